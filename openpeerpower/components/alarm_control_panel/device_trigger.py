@@ -11,6 +11,7 @@ from openpeerpower.components.alarm_control_panel.const import (
 from openpeerpower.components.automation import AutomationActionType, state
 from openpeerpower.components.device_automation import TRIGGER_BASE_SCHEMA
 from openpeerpower.const import (
+    ATTR_SUPPORTED_FEATURES,
     CONF_DEVICE_ID,
     CONF_DOMAIN,
     CONF_ENTITY_ID,
@@ -37,6 +38,24 @@ TRIGGER_TYPES = {
     "armed_night",
 }
 
+# Trigger types offered per entity, with the feature each one requires
+_TRIGGER_TYPES_FOR_FEATURES = (
+    ("disarmed", 0),
+    ("triggered", 0),
+    ("armed_home", SUPPORT_ALARM_ARM_HOME),
+    ("armed_away", SUPPORT_ALARM_ARM_AWAY),
+    ("armed_night", SUPPORT_ALARM_ARM_NIGHT),
+)
+
+# Maps trigger type to the (from, to) states of the underlying state trigger
+_TYPE_TO_STATES = {
+    "triggered": (STATE_ALARM_PENDING, STATE_ALARM_TRIGGERED),
+    "disarmed": (STATE_ALARM_TRIGGERED, STATE_ALARM_DISARMED),
+    "armed_home": (STATE_ALARM_PENDING, STATE_ALARM_ARMED_HOME),
+    "armed_away": (STATE_ALARM_PENDING, STATE_ALARM_ARMED_AWAY),
+    "armed_night": (STATE_ALARM_PENDING, STATE_ALARM_ARMED_NIGHT),
+}
+
 TRIGGER_SCHEMA = TRIGGER_BASE_SCHEMA.extend(
     {
         vol.Required(CONF_ENTITY_ID): cv.entity_id,
@@ -49,67 +68,32 @@ async def async_get_triggers(opp: OpenPeerPower, device_id: str) -> List[dict]:
     """List device triggers for Alarm control panel devices."""
     registry = await entity_registry.async_get_registry(opp)
     triggers = []
+    trigger_base = {
+        CONF_PLATFORM: "device",
+        CONF_DEVICE_ID: device_id,
+        CONF_DOMAIN: DOMAIN,
+    }
 
     # Get all the integrations entities for this device
     for entry in entity_registry.async_entries_for_device(registry, device_id):
         if entry.domain != DOMAIN:
             continue
 
-        entity_state = opp.states.get(entry.entity_id)
+        entity_id = entry.entity_id
+        entity_state = opp.states.get(entity_id)
 
         # We need a state or else we can't populate the HVAC and preset modes.
         if entity_state is None:
             continue
 
-        supported_features = entity_state.attributes["supported_features"]
+        supported_features = entity_state.attributes.get(ATTR_SUPPORTED_FEATURES, 0)
 
         # Add triggers for each entity that belongs to this integration
-        triggers += [
-            {
-                CONF_PLATFORM: "device",
-                CONF_DEVICE_ID: device_id,
-                CONF_DOMAIN: DOMAIN,
-                CONF_ENTITY_ID: entry.entity_id,
-                CONF_TYPE: "disarmed",
-            },
-            {
-                CONF_PLATFORM: "device",
-                CONF_DEVICE_ID: device_id,
-                CONF_DOMAIN: DOMAIN,
-                CONF_ENTITY_ID: entry.entity_id,
-                CONF_TYPE: "triggered",
-            },
-        ]
-        if supported_features & SUPPORT_ALARM_ARM_HOME:
-            triggers.append(
-                {
-                    CONF_PLATFORM: "device",
-                    CONF_DEVICE_ID: device_id,
-                    CONF_DOMAIN: DOMAIN,
-                    CONF_ENTITY_ID: entry.entity_id,
-                    CONF_TYPE: "armed_home",
-                }
-            )
-        if supported_features & SUPPORT_ALARM_ARM_AWAY:
-            triggers.append(
-                {
-                    CONF_PLATFORM: "device",
-                    CONF_DEVICE_ID: device_id,
-                    CONF_DOMAIN: DOMAIN,
-                    CONF_ENTITY_ID: entry.entity_id,
-                    CONF_TYPE: "armed_away",
-                }
-            )
-        if supported_features & SUPPORT_ALARM_ARM_NIGHT:
-            triggers.append(
-                {
-                    CONF_PLATFORM: "device",
-                    CONF_DEVICE_ID: device_id,
-                    CONF_DOMAIN: DOMAIN,
-                    CONF_ENTITY_ID: entry.entity_id,
-                    CONF_TYPE: "armed_night",
-                }
-            )
+        triggers.extend(
+            {**trigger_base, CONF_ENTITY_ID: entity_id, CONF_TYPE: trigger_type}
+            for trigger_type, required_feature in _TRIGGER_TYPES_FOR_FEATURES
+            if not required_feature or supported_features & required_feature
+        )
 
     return triggers
 
@@ -123,21 +107,7 @@ async def async_attach_trigger(
     """Attach a trigger."""
     config = TRIGGER_SCHEMA(config)
 
-    if config[CONF_TYPE] == "triggered":
-        from_state = STATE_ALARM_PENDING
-        to_state = STATE_ALARM_TRIGGERED
-    elif config[CONF_TYPE] == "disarmed":
-        from_state = STATE_ALARM_TRIGGERED
-        to_state = STATE_ALARM_DISARMED
-    elif config[CONF_TYPE] == "armed_home":
-        from_state = STATE_ALARM_PENDING
-        to_state = STATE_ALARM_ARMED_HOME
-    elif config[CONF_TYPE] == "armed_away":
-        from_state = STATE_ALARM_PENDING
-        to_state = STATE_ALARM_ARMED_AWAY
-    elif config[CONF_TYPE] == "armed_night":
-        from_state = STATE_ALARM_PENDING
-        to_state = STATE_ALARM_ARMED_NIGHT
+    from_state, to_state = _TYPE_TO_STATES[config[CONF_TYPE]]
 
     state_config = {
         state.CONF_PLATFORM: "state",
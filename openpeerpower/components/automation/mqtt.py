@@ -36,6 +36,11 @@ async def async_attach_trigger(opp, config, action, automation_info):
     encoding = config[CONF_ENCODING] or None
     qos = config[CONF_QOS]
 
+    if payload is not None and encoding is None:
+        # Messages are delivered as raw bytes without an encoding, so compare
+        # against the encoded payload once instead of never matching.
+        payload = payload.encode(DEFAULT_ENCODING)
+
     @callback
     def mqtt_automation_listener(mqttmsg):
         """Listen for MQTT messages."""
@@ -33,7 +33,7 @@ class MobileAppFlowHandler(config_entries.ConfigFlow):
                 f"{user_input[ATTR_APP_ID]}-{user_input[ATTR_DEVICE_ID]}"
             )
         else:
-            user_input[ATTR_DEVICE_ID] = str(uuid.uuid4()).replace("-", "")
+            user_input[ATTR_DEVICE_ID] = uuid.uuid4().hex
 
         # Register device tracker entity and add to person registering app
         ent_reg = await entity_registry.async_get_registry(self.opp)
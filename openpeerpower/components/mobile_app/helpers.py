@@ -1,4 +1,5 @@
 """Helpers for mobile_app."""
+from functools import lru_cache
 import json
 import logging
 from typing import Callable, Dict, Tuple
@@ -108,8 +109,12 @@ def error_response(
     )
 
 
+@lru_cache(maxsize=1)
 def supports_encryption() -> bool:
-    """Test if we support encryption."""
+    """Test if we support encryption.
+
+    The result cannot change while running, so it is only computed once.
+    """
     try:
         import nacl  # noqa: F401 pylint: disable=unused-import, import-outside-toplevel
 
@@ -25,6 +25,7 @@ class APICount(Entity):
     def __init__(self):
         """Initialize the API count."""
         self.count = None
+        self._update_pending = False
 
     async def async_added_to_opp(self):
         """Added to opp."""
@@ -34,7 +35,8 @@ class APICount(Entity):
         self.opp.helpers.dispatcher.async_dispatcher_connect(
             SIGNAL_WEBSOCKET_DISCONNECTED, self._update_count
         )
-        self._update_count()
+        # The initial state is written by the entity platform once added
+        self.count = self.opp.data.get(DATA_CONNECTIONS, 0)
 
     @property
     def name(self):
@@ -53,5 +55,15 @@ class APICount(Entity):
 
     @callback
     def _update_count(self):
+        """Schedule a state write, coalescing bursts of (dis)connects."""
+        if self._update_pending:
+            return
+
+        self._update_pending = True
+        self.opp.async_create_task(self._async_write_count())
+
+    async def _async_write_count(self):
+        """Write the current connection count to the state machine."""
+        self._update_pending = False
         self.count = self.opp.data.get(DATA_CONNECTIONS, 0)
-        self.async_schedule_update_op_state()
+        self.async_write_op_state()
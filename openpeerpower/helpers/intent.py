@@ -1,7 +1,9 @@
 """Module to coordinate user intentions."""
+from functools import lru_cache
 import logging
 import re
-from typing import Any, Callable, Dict, Iterable, Optional
+import sys
+from typing import Any, Callable, Dict, Iterable, Optional, Pattern, Type, Union
 
 import voluptuous as vol
 
@@ -37,6 +39,9 @@ def async_register(opp: OpenPeerPowerType, handler: "IntentHandler") -> None:
 
     assert handler.intent_type is not None, "intent_type cannot be None"
 
+    # Interned so lookups with string literal intent types compare by identity
+    handler.intent_type = sys.intern(handler.intent_type)
+
     if handler.intent_type in intents:
         _LOGGER.warning(
             "Intent %s is being overwritten by %s.", handler.intent_type, handler
@@ -106,13 +111,21 @@ def async_match_state(
     """Find a state that matches the name."""
     if states is None:
         states = opp.states.async_all()
+    else:
+        # States are iterated twice when there is no exact match
+        states = list(states)
+
+    lower_name = name.lower()
+    for state in states:
+        if state.name.lower() == lower_name:
+            return state
 
-    state = _fuzzymatch(name, states, lambda state: state.name)
+    match = _fuzzymatch(name, states, lambda state: state.name)
 
-    if state is None:
+    if match is None:
         raise IntentHandleError(f"Unable to find an entity called {name}")
 
-    return state
+    return match
 
 
 @callback
@@ -141,8 +154,15 @@ class IntentHandler:
         if self.slot_schema is None:
             return slots
 
-        if self._slot_schema is None:
-            self._slot_schema = vol.Schema(
+        # A schema set on the class is compiled once and shared by all its
+        # instances, one set on the instance is compiled for that instance.
+        owner: Union["IntentHandler", Type["IntentHandler"]] = (
+            self if "slot_schema" in vars(self) else type(self)
+        )
+        compiled = vars(owner).get("_slot_schema")
+
+        if compiled is None:
+            compiled = owner._slot_schema = vol.Schema(
                 {
                     key: SLOT_SCHEMA.extend({"value": validator})
                     for key, validator in self.slot_schema.items()
@@ -150,7 +170,7 @@ class IntentHandler:
                 extra=vol.ALLOW_EXTRA,
             )
 
-        return self._slot_schema(slots)  # type: ignore
+        return compiled(slots)  # type: ignore
 
     async def async_handle(self, intent_obj: "Intent") -> "IntentResponse":
         """Handle the intent."""
@@ -161,18 +181,23 @@ class IntentHandler:
         return f"<{self.__class__.__name__} - {self.intent_type}>"
 
 
+@lru_cache(maxsize=256)
+def _fuzzymatch_regex(name: str) -> Pattern:
+    """Return the compiled fuzzy matching regex for a name."""
+    return re.compile(".*?".join(name), re.IGNORECASE)
+
+
 def _fuzzymatch(name: str, items: Iterable[T], key: Callable[[T], str]) -> Optional[T]:
     """Fuzzy matching function."""
     matches = []
-    pattern = ".*?".join(name)
-    regex = re.compile(pattern, re.IGNORECASE)
+    regex = _fuzzymatch_regex(name)
     for idx, item in enumerate(items):
         match = regex.search(key(item))
         if match:
             # Add index so we pick first match in case same group and start
             matches.append((len(match.group()), match.start(), idx, item))
 
-    return sorted(matches)[0][3] if matches else None
+    return min(matches)[3] if matches else None
 
 
 class ServiceIntentHandler(IntentHandler):
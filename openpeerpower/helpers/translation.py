@@ -1,6 +1,9 @@
 """Translation string lookup helpers."""
+import asyncio
 import logging
-from typing import Any, Dict, Iterable, Optional
+import os
+import re
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Tuple, cast
 
 from openpeerpower.loader import (
     async_get_config_flows,
@@ -9,21 +12,39 @@ from openpeerpower.loader import (
 )
 from openpeerpower.util.json import load_json
 
+from .storage import Store
 from .typing import OpenPeerPowerType
 
 _LOGGER = logging.getLogger(__name__)
 
 TRANSLATION_STRING_CACHE = "translation_string_cache"
+TRANSLATION_STORE_CACHE = "translation_store_cache"
+TRANSLATION_RESULT_CACHE = "translation_result_cache"
+STORAGE_KEY = "core.translations"
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
+
+# Languages are part of the storage key, only well formed ones are persisted
+LANGUAGE_RE = re.compile(r"^[a-zA-Z]{2,3}([-_][a-zA-Z0-9]+)*$")
 
 
 def recursive_flatten(prefix: Any, data: Dict) -> Dict[str, Any]:
-    """Return a flattened representation of dict data."""
+    """Return a flattened representation of dict data.
+
+    Nested dicts are walked with an explicit stack of iterators, so keys end
+    up in the same order as a depth-first recursive walk would produce.
+    """
     output = {}
-    for key, value in data.items():
-        if isinstance(value, dict):
-            output.update(recursive_flatten(f"{prefix}{key}.", value))
+    stack = [(f"{prefix}", iter(data.items()))]
+    while stack:
+        cur_prefix, items = stack[-1]
+        for key, value in items:
+            if isinstance(value, dict):
+                stack.append((f"{cur_prefix}{key}.", iter(value.items())))
+                break
+            output[f"{cur_prefix}{key}"] = value
         else:
-            output[f"{prefix}{key}"] = value
+            stack.pop()
     return output
 
 
@@ -65,17 +86,31 @@ async def component_translation_file(
     return str(integration.file_path / ".translations" / filename)
 
 
-def load_translations_files(
-    translation_files: Dict[str, str]
-) -> Dict[str, Dict[str, Any]]:
-    """Load and parse translation.json files."""
-    loaded = {}
-    for component, translation_file in translation_files.items():
-        loaded_json = load_json(translation_file)
-        assert isinstance(loaded_json, dict)
-        loaded[component] = loaded_json
+def load_translations_file(
+    translation_file: str, cached: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Load and parse a translation.json file.
+
+    Returns the stored entry for the file, which holds its path, a signature of
+    its modification time and size, and the parsed strings. The cached entry is
+    returned as is when the file did not change since it was stored.
+    """
+    try:
+        stat = os.stat(translation_file)
+        signature: Optional[list] = [stat.st_mtime_ns, stat.st_size]
+    except OSError:
+        signature = None
+
+    if (
+        cached is not None
+        and cached["path"] == translation_file
+        and cached["signature"] == signature
+    ):
+        return cached
 
-    return loaded
+    loaded_json = load_json(translation_file)
+    assert isinstance(loaded_json, dict)
+    return {"path": translation_file, "signature": signature, "strings": loaded_json}
 
 
 def build_resources(
@@ -101,6 +136,22 @@ def build_resources(
     return resources
 
 
+async def _async_get_translation_store(
+    opp: OpenPeerPowerType, language: str
+) -> Tuple[Store, Dict[str, Dict[str, Any]]]:
+    """Return the store and the stored translation entries for a language."""
+    stores: Dict[str, Tuple[Store, Dict[str, Dict[str, Any]]]] = opp.data.setdefault(
+        TRANSLATION_STORE_CACHE, {}
+    )
+
+    if language not in stores:
+        store = Store(opp, STORAGE_VERSION, f"{STORAGE_KEY}.{language}")
+        stored = cast(Optional[Dict[str, Dict[str, Any]]], await store.async_load())
+        stores.setdefault(language, (store, stored or {}))
+
+    return stores[language]
+
+
 @bind_opp
 async def async_get_component_resources(
     opp: OpenPeerPowerType, language: str
@@ -126,16 +177,42 @@ async def async_get_component_resources(
         else:
             missing_files[component] = path
 
-    # Load missing files
+    # Load missing files, spreading them over the executor. Files that did not
+    # change since the last run are served from the translation store.
     if missing_files:
-        load_translations_job = opp.async_add_job(
-            load_translations_files, missing_files
+        store: Optional[Store] = None
+        stored: Dict[str, Dict[str, Any]] = {}
+        if LANGUAGE_RE.match(language):
+            store, stored = await _async_get_translation_store(opp, language)
+
+        loaded_translations = await asyncio.gather(
+            *(
+                opp.async_add_executor_job(
+                    load_translations_file, path, stored.get(component)
+                )
+                for component, path in missing_files.items()
+            )
         )
-        assert load_translations_job is not None
-        loaded_translations = await load_translations_job
 
         # Update cache
-        translation_cache.update(loaded_translations)
+        changed = False
+        for component, entry in zip(missing_files, loaded_translations):
+            translation_cache[component] = entry["strings"]
+            if entry["signature"] is None:
+                # Files that don't exist are not persisted
+                if stored.pop(component, None) is not None:
+                    changed = True
+            elif stored.get(component) is not entry:
+                stored[component] = entry
+                changed = True
+
+        # Drop entries of components that are no longer loaded
+        for component in stored.keys() - components:
+            del stored[component]
+            changed = True
+
+        if changed and store is not None:
+            store.async_delay_save(lambda: stored, SAVE_DELAY)
 
     resources = build_resources(translation_cache, components)
 
@@ -148,11 +225,26 @@ async def async_get_component_resources(
 async def async_get_translations(
     opp: OpenPeerPowerType, language: str
 ) -> Dict[str, Any]:
-    """Return all backend translations."""
+    """Return all backend translations.
+
+    The result is reused for a language until the set of loaded components
+    changes.
+    """
+    components = frozenset(opp.config.components | await async_get_config_flows(opp))
+    result_cache: Dict[
+        str, Tuple[FrozenSet[str], Dict[str, Any]]
+    ] = opp.data.setdefault(TRANSLATION_RESULT_CACHE, {})
+    cached = result_cache.get(language)
+    if cached is not None and cached[0] == components:
+        return cached[1]
+
     resources = await async_get_component_resources(opp, language)
     if language != "en":
-        # Fetch the English resources, as a fallback for missing keys
+        # Fetch the English resources, as a fallback for missing keys. They
+        # are freshly flattened for this call, so merge into them in place.
         base_resources = await async_get_component_resources(opp, "en")
-        resources = {**base_resources, **resources}
+        base_resources.update(resources)
+        resources = base_resources
 
+    result_cache[language] = (components, resources)
     return resources
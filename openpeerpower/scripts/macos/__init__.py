@@ -1,25 +1,24 @@
 """Script to install/uninstall HA into OS X."""
+import getpass
 import os
+import shutil
+import subprocess
 import time
 
 # mypy: allow-untyped-calls, allow-untyped-defs
 
+with open(
+    os.path.join(os.path.dirname(__file__), "launchd.plist"), "r", encoding="utf-8"
+) as _template_file:
+    PLIST_TEMPLATE = _template_file.read()
+
 
 def install_osx():
     """Set up to run via launchd on OS X."""
-    with os.popen("which opp") as inp:
-        opp_path = inp.read().strip()
-
-    with os.popen("whoami") as inp:
-        user = inp.read().strip()
-
-    template_path = os.path.join(os.path.dirname(__file__), "launchd.plist")
-
-    with open(template_path, "r", encoding="utf-8") as inp:
-        plist = inp.read()
+    opp_path = shutil.which("opp") or ""
+    user = getpass.getuser()
 
-    plist = plist.replace("$OPP_PATH$", opp_path)
-    plist = plist.replace("$USER$", user)
+    plist = PLIST_TEMPLATE.replace("$OPP_PATH$", opp_path).replace("$USER$", user)
 
     path = os.path.expanduser("~/Library/LaunchAgents/org.openpeerpower.plist")
 
@@ -30,7 +29,7 @@ def install_osx():
         print(f"Unable to write to {path}", err)
         return
 
-    os.popen(f"launchctl load -w -F {path}")
+    subprocess.run(["launchctl", "load", "-w", "-F", path], check=False)
 
     print(
         "Open Peer Power has been installed. \
@@ -41,27 +40,28 @@ def install_osx():
 def uninstall_osx():
     """Unload from launchd on OS X."""
     path = os.path.expanduser("~/Library/LaunchAgents/org.openpeerpower.plist")
-    os.popen(f"launchctl unload {path}")
+    subprocess.run(["launchctl", "unload", path], check=False)
 
     print("Open Peer Power has been uninstalled.")
 
 
+def restart_osx():
+    """Reload launchd on OS X."""
+    uninstall_osx()
+    # A small delay is needed on some systems to let the unload finish.
+    time.sleep(0.5)
+    install_osx()
+
+
+COMMANDS = {"install": install_osx, "uninstall": uninstall_osx, "restart": restart_osx}
+
+
 def run(args):
     """Handle OSX commandline script."""
-    commands = "install", "uninstall", "restart"
-    if not args or args[0] not in commands:
-        print("Invalid command. Available commands:", ", ".join(commands))
+    command = COMMANDS.get(args[0]) if args else None
+    if command is None:
+        print("Invalid command. Available commands:", ", ".join(COMMANDS))
         return 1
 
-    if args[0] == "install":
-        install_osx()
-        return 0
-    if args[0] == "uninstall":
-        uninstall_osx()
-        return 0
-    if args[0] == "restart":
-        uninstall_osx()
-        # A small delay is needed on some systems to let the unload finish.
-        time.sleep(0.5)
-        install_osx()
-        return 0
+    command()
+    return 0
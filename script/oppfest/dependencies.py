@@ -1,40 +1,142 @@
 """Validate dependencies."""
 import ast
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import json
+import os
 from pathlib import Path
-from typing import Dict, Set
+from typing import Dict, FrozenSet, Iterator, List, Optional, Set, Tuple
 
 from openpeerpower.requirements import DISCOVERY_INTEGRATIONS
 
-from .model import Integration
+from .model import Config, Integration
 
+CACHE_PATH = Path(".oppfest_cache") / "dependencies.json"
+# Bump when the way references are collected changes
+CACHE_VERSION = 1
 
-class ImportCollector(ast.NodeVisitor):
+
+class ReferenceCache:
+    """Cache of references found in source files, keyed by content hash."""
+
+    def __init__(self, cached: Optional[Dict[str, List[str]]] = None):
+        """Initialize the reference cache."""
+        self.cached = cached if cached is not None else {}
+        self.used: Dict[str, List[str]] = {}
+
+    @classmethod
+    def load(cls, path: Path) -> "ReferenceCache":
+        """Load the cache from disk."""
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return cls()
+
+        if data.get("version") != CACHE_VERSION:
+            return cls()
+
+        return cls(data["references"])
+
+    def save(self, path: Path) -> None:
+        """Write the references used in this run to disk."""
+        if self.used == self.cached:
+            return
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(
+            json.dumps({"version": CACHE_VERSION, "references": self.used})
+        )
+        os.replace(tmp_path, path)
+
+    def get(self, digest: str) -> Optional[Set[str]]:
+        """Return the cached references of a file or None if unknown."""
+        references = self.cached.get(digest)
+        if references is None:
+            return None
+
+        self.used[digest] = references
+        return set(references)
+
+    def set(self, digest: str, references: Set[str]) -> None:
+        """Store the references of a file."""
+        self.used[digest] = sorted(references)
+
+
+def iter_py_files(root: Path) -> Iterator[Path]:
+    """Yield all Python files under root.
+
+    Uses the file type reported by the directory listing instead of a stat
+    call per file.
+    """
+    dirs = [root]
+    while dirs:
+        with os.scandir(dirs.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    dirs.append(Path(entry.path))
+                elif entry.name.endswith(".py") and entry.is_file(
+                    follow_symlinks=False
+                ):
+                    yield Path(entry.path)
+
+
+class ImportCollector:
     """Collect all integrations referenced."""
 
-    def __init__(self, integration: Integration):
+    def __init__(
+        self, integration: Integration, cache: Optional[ReferenceCache] = None
+    ):
         """Initialize the import collector."""
         self.integration = integration
-        self.referenced: Dict[Path, Set[str]] = {}
+        self.cache = cache
+        # References per platform, keyed by the top level file or directory:
+        # climate/__init__.py and climate.py are both stored as climate
+        self.referenced: Dict[str, Set[str]] = {}
 
-        # Current file or dir we're inspecting
-        self._cur_fil_dir = None
+        # References found in the file we're inspecting
+        self._cur_references: Set[str] = set()
 
     def collect(self) -> None:
         """Collect imports from a source file."""
-        for fil in self.integration.path.glob("**/*.py"):
-            if not fil.is_file():
+        for fil in iter_py_files(self.integration.path):
+            parts = fil.relative_to(self.integration.path).parts
+            references = self.referenced.setdefault(
+                parts[0] if len(parts) > 1 else fil.stem, set()
+            )
+            data = fil.read_bytes()
+
+            # Files that cannot reference an integration are not parsed, every
+            # reference ImportCollector finds contains the name components
+            if b"components" not in data:
+                continue
+
+            digest = hashlib.sha256(data).hexdigest()
+
+            # Unchanged files are not parsed again
+            cached = self.cache.get(digest) if self.cache is not None else None
+            if cached is not None:
+                references.update(cached)
                 continue
 
-            self._cur_fil_dir = fil.relative_to(self.integration.path)
-            self.referenced[self._cur_fil_dir] = set()
-            self.visit(ast.parse(fil.read_text()))
-            self._cur_fil_dir = None
+            self._cur_references = set()
+            self._visit(compile(data, str(fil), "exec", ast.PyCF_ONLY_AST))
+            references.update(self._cur_references)
+            if self.cache is not None:
+                self.cache.set(digest, self._cur_references)
+
+    def _visit(self, tree: ast.AST) -> None:
+        """Visit all nodes of a tree that can reference an integration."""
+        for node in ast.walk(tree):
+            handler = NODE_HANDLERS.get(type(node))
+            if handler is not None:
+                handler(self, node)
 
     def _add_reference(self, reference_domain: str):
         """Add a reference."""
-        self.referenced[self._cur_fil_dir].add(reference_domain)
+        self._cur_references.add(reference_domain)
 
-    def visit_ImportFrom(self, node):
+    def visit_import_from(self, node):
         """Visit ImportFrom node."""
         if node.module is None:
             return
@@ -49,14 +151,14 @@ class ImportCollector(ast.NodeVisitor):
             for name_node in node.names:
                 self._add_reference(name_node.name)
 
-    def visit_Import(self, node):
+    def visit_import(self, node):
         """Visit Import node."""
         # import openpeerpower.components.hue as hue
         for name_node in node.names:
             if name_node.name.startswith("openpeerpower.components."):
                 self._add_reference(name_node.name.split(".")[2])
 
-    def visit_Attribute(self, node):
+    def visit_attribute(self, node):
         """Visit Attribute node."""
         # opp.components.hue.async_create()
         # Name(id=opp)
@@ -83,71 +185,116 @@ class ImportCollector(ast.NodeVisitor):
             )
         ):
             self._add_reference(node.attr)
-        else:
-            # Have it visit other kids
-            self.generic_visit(node)
-
-
-ALLOWED_USED_COMPONENTS = {
-    # This component will always be set up
-    "persistent_notification",
-    # These allow to register things without being set up
-    "conversation",
-    "frontend",
-    "oppio",
-    "system_health",
-    "websocket_api",
-    "automation",
-    "device_automation",
-    "zone",
-    "openpeerpower",
-    "system_log",
-    "person",
-    # Other
-    "mjpeg",  # base class, has no reqs or component to load.
-    "stream",  # Stream cannot install on all systems, can be imported without reqs.
-}
 
-IGNORE_VIOLATIONS = {
-    # Has same requirement, gets defaults.
-    ("sql", "recorder"),
-    # Sharing a base class
-    ("openalpr_cloud", "openalpr_local"),
-    ("lutron_caseta", "lutron"),
-    ("ffmpeg_noise", "ffmpeg_motion"),
-    # Demo
-    ("demo", "manual"),
-    ("demo", "openalpr_local"),
-    # This should become a helper method that integrations can submit data to
-    ("websocket_api", "devcon"),
-    ("websocket_api", "shopping_list"),
-    # Expose OP to external systems
-    "homekit",
-    "alexa",
-    "google_assistant",
-    "emulated_hue",
-    "prometheus",
-    "conversation",
-    "logbook",
-    "mobile_app",
-    # These should be extracted to external package
-    "pvoutput",
-    "dwd_weather_warnings",
+
+# Dispatch on the exact node type, ast.walk already visits all children
+NODE_HANDLERS = {
+    ast.ImportFrom: ImportCollector.visit_import_from,
+    ast.Import: ImportCollector.visit_import,
+    ast.Attribute: ImportCollector.visit_attribute,
 }
 
 
+ALLOWED_USED_COMPONENTS = frozenset(
+    {
+        # This component will always be set up
+        "persistent_notification",
+        # These allow to register things without being set up
+        "conversation",
+        "frontend",
+        "oppio",
+        "system_health",
+        "websocket_api",
+        "automation",
+        "device_automation",
+        "zone",
+        "openpeerpower",
+        "system_log",
+        "person",
+        # Other
+        "mjpeg",  # base class, has no reqs or component to load.
+        "stream",  # Stream cannot install on all systems, can be imported without reqs.
+    }
+)
+
+IGNORE_VIOLATIONS = frozenset(
+    {
+        # Has same requirement, gets defaults.
+        ("sql", "recorder"),
+        # Sharing a base class
+        ("openalpr_cloud", "openalpr_local"),
+        ("lutron_caseta", "lutron"),
+        ("ffmpeg_noise", "ffmpeg_motion"),
+        # Demo
+        ("demo", "manual"),
+        ("demo", "openalpr_local"),
+        # This should become a helper method that integrations can submit data to
+        ("websocket_api", "devcon"),
+        ("websocket_api", "shopping_list"),
+        # Expose OP to external systems
+        "homekit",
+        "alexa",
+        "google_assistant",
+        "emulated_hue",
+        "prometheus",
+        "conversation",
+        "logbook",
+        "mobile_app",
+        # These should be extracted to external package
+        "pvoutput",
+        "dwd_weather_warnings",
+    }
+)
+
+# Integrations that are allowed to have violations
+IGNORE_VIOLATIONS_DOMAINS = frozenset(
+    violation for violation in IGNORE_VIOLATIONS if isinstance(violation, str)
+)
+
+
+def _calc_ignored_references() -> Dict[str, FrozenSet[str]]:
+    """Return the whitelisted references, by the domain making them."""
+    ignored_references: Dict[str, Set[str]] = {}
+    for violation in IGNORE_VIOLATIONS:
+        if isinstance(violation, tuple):
+            domain, reference = violation
+            ignored_references.setdefault(domain, set()).add(reference)
+
+    return {
+        domain: frozenset(references)
+        for domain, references in ignored_references.items()
+    }
+
+
+# Whitelisted references, by the domain of the integration making them
+IGNORE_VIOLATIONS_REFERENCES = _calc_ignored_references()
+
+
+def _calc_discovery_by_key() -> Dict[str, List[str]]:
+    """Return the discovery integrations, by the manifest key allowing them."""
+    discovery_by_key: Dict[str, List[str]] = {}
+    for check_domain, to_check in DISCOVERY_INTEGRATIONS.items():
+        for check in to_check:
+            discovery_by_key.setdefault(check, []).append(check_domain)
+
+    return discovery_by_key
+
+
+# Discovery integrations, by the manifest key that allows referencing them
+_DISCOVERY_BY_KEY = _calc_discovery_by_key()
+
+
 def calc_allowed_references(integration: Integration) -> Set[str]:
     """Return a set of allowed references."""
-    allowed_references = (
-        ALLOWED_USED_COMPONENTS
-        | set(integration.manifest["dependencies"])
-        | set(integration.manifest.get("after_dependencies", []))
+    allowed_references = set(ALLOWED_USED_COMPONENTS)
+    allowed_references.update(
+        integration.manifest["dependencies"],
+        integration.manifest.get("after_dependencies", ()),
     )
 
     # Discovery requirements are ok if referenced in manifest
-    for check_domain, to_check in DISCOVERY_INTEGRATIONS.items():
-        if any(check in integration.manifest for check in to_check):
-            allowed_references.add(check_domain)
+    for check in integration.manifest.keys() & _DISCOVERY_BY_KEY.keys():
+        allowed_references.update(_DISCOVERY_BY_KEY[check])
 
     return allowed_references
 
@@ -155,24 +302,31 @@ def calc_allowed_references(integration: Integration) -> Set[str]:
 def find_non_referenced_integrations(
     integrations: Dict[str, Integration],
     integration: Integration,
-    references: Dict[Path, Set[str]],
+    references: Dict[str, Set[str]],
 ):
     """Find intergrations that are not allowed to be referenced."""
     allowed_references = calc_allowed_references(integration)
     referenced = set()
-    for path, refs in references.items():
-        if len(path.parts) == 1:
-            # climate.py is stored as climate
-            cur_fil_dir = path.stem
-        else:
-            # climate/__init__.py is stored as climate
-            cur_fil_dir = path.parts[0]
+
+    # Platforms specified in this integration, as a file or a directory
+    platforms = set()
+    with os.scandir(integration.path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                platforms.add(entry.name)
+            elif entry.name.endswith(".py") and entry.is_file():
+                platforms.add(entry.name[:-3])
+
+    domain = integration.domain
+    ignored_references = IGNORE_VIOLATIONS_REFERENCES.get(domain, frozenset())
+
+    for cur_fil_dir, refs in references.items():
 
         is_platform_other_integration = cur_fil_dir in integrations
 
         for ref in refs:
             # We are always allowed to import from ourselves
-            if ref == integration.domain:
+            if ref == domain:
                 continue
 
             # These references are approved based on the manifest
@@ -180,7 +334,7 @@ def find_non_referenced_integrations(
                 continue
 
             # Some violations are whitelisted
-            if (integration.domain, ref) in IGNORE_VIOLATIONS:
+            if ref in ignored_references:
                 continue
 
             # If it's a platform for another integration, the other integration is ok
@@ -188,11 +342,7 @@ def find_non_referenced_integrations(
                 continue
 
             # These have a platform specified in this integration
-            if not is_platform_other_integration and (
-                (integration.path / f"{ref}.py").is_file()
-                # Platform dir
-                or (integration.path / ref).is_dir()
-            ):
+            if not is_platform_other_integration and ref in platforms:
                 continue
 
             referenced.add(ref)
@@ -200,22 +350,14 @@ def find_non_referenced_integrations(
     return referenced
 
 
-def validate_dependencies(
-    integrations: Dict[str, Integration], integration: Integration
+def report_non_referenced_integrations(
+    integrations: Dict[str, Integration],
+    integration: Integration,
+    references: Dict[str, Set[str]],
 ):
-    """Validate all dependencies."""
-    # Some integrations are allowed to have violations.
-    if integration.domain in IGNORE_VIOLATIONS:
-        return
-
-    # Find usage of opp.components
-    collector = ImportCollector(integration)
-    collector.collect()
-
+    """Add an error for each integration used but not depended on."""
     for domain in sorted(
-        find_non_referenced_integrations(
-            integrations, integration, collector.referenced
-        )
+        find_non_referenced_integrations(integrations, integration, references)
     ):
         integration.add_error(
             "dependencies",
@@ -224,15 +366,56 @@ def validate_dependencies(
         )
 
 
-def validate(integrations: Dict[str, Integration], config):
+_WORKER_CACHED: Dict[str, List[str]] = {}
+
+
+def _init_worker(cached: Dict[str, List[str]]) -> None:
+    """Share the loaded cache with a worker process."""
+    global _WORKER_CACHED  # pylint: disable=global-statement
+    _WORKER_CACHED = cached
+
+
+def _collect_references(
+    integration: Integration,
+) -> Tuple[Dict[str, Set[str]], Dict[str, List[str]]]:
+    """Collect the references of an integration in a worker process.
+
+    Returns the references and the cache entries used to find them.
+    """
+    cache = ReferenceCache(_WORKER_CACHED)
+    collector = ImportCollector(integration, cache)
+    collector.collect()
+    return collector.referenced, cache.used
+
+
+def validate(integrations: Dict[str, Integration], config: Config):
     """Handle dependencies for integrations."""
+    cache_path = config.root / CACHE_PATH
+    cache = ReferenceCache.load(cache_path)
+
+    # Find usage of opp.components, parsing integrations on all cores.
+    # Some integrations are allowed to have violations.
+    to_collect = [
+        integration
+        for integration in integrations.values()
+        if integration.manifest and integration.domain not in IGNORE_VIOLATIONS_DOMAINS
+    ]
+    with ProcessPoolExecutor(
+        initializer=_init_worker, initargs=(cache.cached,)
+    ) as executor:
+        for integration, (references, used) in zip(
+            to_collect, executor.map(_collect_references, to_collect)
+        ):
+            cache.used.update(used)
+            report_non_referenced_integrations(integrations, integration, references)
+
+    cache.save(cache_path)
+
     # check for non-existing dependencies
     for integration in integrations.values():
         if not integration.manifest:
             continue
 
-        validate_dependencies(integrations, integration)
-
         # check that all referenced dependencies exist
         for dep in integration.manifest["dependencies"]:
             if dep not in integrations:
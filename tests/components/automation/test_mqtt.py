@@ -140,3 +140,30 @@ async def test_encoding_custom(opp, calls):
     )
 
     mock_mqtt.async_subscribe.assert_called_once_with("test-topic", mock.ANY, 0, None)
+
+
+async def test_if_fires_on_payload_match_without_encoding(opp, calls):
+    """Test if message is fired on payload match without encoding."""
+    assert await async_setup_component(
+        opp,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                "trigger": {
+                    "platform": "mqtt",
+                    "topic": "test-topic",
+                    "payload": "hello",
+                    "encoding": "",
+                },
+                "action": {"service": "test.automation"},
+            }
+        },
+    )
+
+    async_fire_mqtt_message(opp, "test-topic", b"hello")
+    await opp.async_block_till_done()
+    assert 1 == len(calls)
+
+    async_fire_mqtt_message(opp, "test-topic", b"no-hello")
+    await opp.async_block_till_done()
+    assert 1 == len(calls)
@@ -20,6 +20,7 @@ async def test_websocket_api(
     assert state.state == "0"
 
     await test_auth_active_with_token(opp, no_auth_websocket_client, opp_access_token)
+    await opp.async_block_till_done()
 
     state = opp.states.get("sensor.connected_clients")
     assert state.state == "1"
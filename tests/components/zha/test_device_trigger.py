@@ -22,15 +22,27 @@ SHORT_PRESS = "remote_button_short_press"
 LONG_PRESS = "remote_button_long_press"
 LONG_RELEASE = "remote_button_long_release"
 
-
-def _same_lists(list_a, list_b):
-    if len(list_a) != len(list_b):
-        return False
-
-    for item in list_a:
-        if item not in list_b:
-            return False
-    return True
+DEVICE_AUTOMATION_TRIGGERS = {
+    (SHAKEN, SHAKEN): {COMMAND: COMMAND_SHAKE},
+    (DOUBLE_PRESS, DOUBLE_PRESS): {COMMAND: COMMAND_DOUBLE},
+    (SHORT_PRESS, SHORT_PRESS): {COMMAND: COMMAND_SINGLE},
+    (LONG_PRESS, LONG_PRESS): {COMMAND: COMMAND_HOLD},
+    (LONG_RELEASE, LONG_RELEASE): {COMMAND: COMMAND_HOLD},
+}
+
+
+def _expected_triggers(device_id):
+    """Return the triggers expected for DEVICE_AUTOMATION_TRIGGERS."""
+    return [
+        {
+            "device_id": device_id,
+            "domain": "zha",
+            "platform": "device",
+            "type": trigger_type,
+            "subtype": subtype,
+        }
+        for trigger_type, subtype in DEVICE_AUTOMATION_TRIGGERS
+    ]
 
 
 @pytest.fixture
@@ -64,13 +76,7 @@ async def test_triggers(opp, mock_devices):
 
     zigpy_device, zha_device = mock_devices
 
-    zigpy_device.device_automation_triggers = {
-        (SHAKEN, SHAKEN): {COMMAND: COMMAND_SHAKE},
-        (DOUBLE_PRESS, DOUBLE_PRESS): {COMMAND: COMMAND_DOUBLE},
-        (SHORT_PRESS, SHORT_PRESS): {COMMAND: COMMAND_SINGLE},
-        (LONG_PRESS, LONG_PRESS): {COMMAND: COMMAND_HOLD},
-        (LONG_RELEASE, LONG_RELEASE): {COMMAND: COMMAND_HOLD},
-    }
+    zigpy_device.device_automation_triggers = DEVICE_AUTOMATION_TRIGGERS
 
     ieee_address = str(zha_device.ieee)
 
@@ -79,44 +85,11 @@ async def test_triggers(opp, mock_devices):
 
     triggers = await async_get_device_automations(opp, "trigger", reg_device.id)
 
-    expected_triggers = [
-        {
-            "device_id": reg_device.id,
-            "domain": "zha",
-            "platform": "device",
-            "type": SHAKEN,
-            "subtype": SHAKEN,
-        },
-        {
-            "device_id": reg_device.id,
-            "domain": "zha",
-            "platform": "device",
-            "type": DOUBLE_PRESS,
-            "subtype": DOUBLE_PRESS,
-        },
-        {
-            "device_id": reg_device.id,
-            "domain": "zha",
-            "platform": "device",
-            "type": SHORT_PRESS,
-            "subtype": SHORT_PRESS,
-        },
-        {
-            "device_id": reg_device.id,
-            "domain": "zha",
-            "platform": "device",
-            "type": LONG_PRESS,
-            "subtype": LONG_PRESS,
-        },
-        {
-            "device_id": reg_device.id,
-            "domain": "zha",
-            "platform": "device",
-            "type": LONG_RELEASE,
-            "subtype": LONG_RELEASE,
-        },
-    ]
-    assert _same_lists(triggers, expected_triggers)
+    expected_triggers = _expected_triggers(reg_device.id)
+    assert len(triggers) == len(expected_triggers)
+    assert {frozenset(trigger.items()) for trigger in triggers} == {
+        frozenset(trigger.items()) for trigger in expected_triggers
+    }
 
 
 async def test_no_triggers(opp, mock_devices):
@@ -137,13 +110,7 @@ async def test_if_fires_on_event(opp, mock_devices, calls):
 
     zigpy_device, zha_device = mock_devices
 
-    zigpy_device.device_automation_triggers = {
-        (SHAKEN, SHAKEN): {COMMAND: COMMAND_SHAKE},
-        (DOUBLE_PRESS, DOUBLE_PRESS): {COMMAND: COMMAND_DOUBLE},
-        (SHORT_PRESS, SHORT_PRESS): {COMMAND: COMMAND_SINGLE},
-        (LONG_PRESS, LONG_PRESS): {COMMAND: COMMAND_HOLD},
-        (LONG_RELEASE, LONG_RELEASE): {COMMAND: COMMAND_HOLD},
-    }
+    zigpy_device.device_automation_triggers = DEVICE_AUTOMATION_TRIGGERS
 
     ieee_address = str(zha_device.ieee)
     op_device_registry = await async_get_registry(opp)
@@ -220,13 +187,7 @@ async def test_exception_bad_trigger(opp, mock_devices, calls, caplog):
 
     zigpy_device, zha_device = mock_devices
 
-    zigpy_device.device_automation_triggers = {
-        (SHAKEN, SHAKEN): {COMMAND: COMMAND_SHAKE},
-        (DOUBLE_PRESS, DOUBLE_PRESS): {COMMAND: COMMAND_DOUBLE},
-        (SHORT_PRESS, SHORT_PRESS): {COMMAND: COMMAND_SINGLE},
-        (LONG_PRESS, LONG_PRESS): {COMMAND: COMMAND_HOLD},
-        (LONG_RELEASE, LONG_RELEASE): {COMMAND: COMMAND_HOLD},
-    }
+    zigpy_device.device_automation_triggers = DEVICE_AUTOMATION_TRIGGERS
 
     ieee_address = str(zha_device.ieee)
     op_device_registry = await async_get_registry(opp)
@@ -0,0 +1 @@
+"""Test the helpers."""
@@ -0,0 +1,79 @@
+"""Test the translation helper."""
+import json
+import os
+
+from asynctest import patch
+import pytest
+
+from openpeerpower.helpers import translation
+
+
+@pytest.fixture
+def translation_file(tmp_path):
+    """Return a translation file for the switch component."""
+    path = tmp_path / "en.json"
+    path.write_text(json.dumps({"state": {"on": "On"}}))
+    return str(path)
+
+
+@pytest.fixture
+def mock_translation_file(opp, translation_file):
+    """Serve the translation file for all loaded components."""
+    opp.config.components.add("switch")
+    with patch(
+        "openpeerpower.helpers.translation.async_get_config_flows", return_value=set(),
+    ), patch(
+        "openpeerpower.helpers.translation.component_translation_file",
+        return_value=translation_file,
+    ):
+        yield
+
+
+async def test_translations_from_store(
+    opp, opp_storage, translation_file, mock_translation_file
+):
+    """Test unchanged translation files are served from the store."""
+    stat = os.stat(translation_file)
+    opp_storage[f"{translation.STORAGE_KEY}.en"] = {
+        "version": translation.STORAGE_VERSION,
+        "key": f"{translation.STORAGE_KEY}.en",
+        "data": {
+            "switch": {
+                "path": translation_file,
+                "signature": [stat.st_mtime_ns, stat.st_size],
+                "strings": {"state": {"on": "Stored"}},
+            }
+        },
+    }
+
+    resources = await translation.async_get_component_resources(opp, "en")
+
+    assert resources == {"component.switch.state.on": "Stored"}
+
+
+async def test_translations_invalid_language_not_stored(
+    opp, opp_storage, mock_translation_file
+):
+    """Test translations of an invalid language are not persisted."""
+    resources = await translation.async_get_component_resources(
+        opp, "/./../../configuration.yaml"
+    )
+
+    assert resources == {"component.switch.state.on": "On"}
+    assert translation.TRANSLATION_STORE_CACHE not in opp.data
+
+
+async def test_translations_missing_file_not_stored(opp, opp_storage):
+    """Test translation files that don't exist are not persisted."""
+    opp.config.components.add("switch")
+    with patch(
+        "openpeerpower.helpers.translation.async_get_config_flows", return_value=set(),
+    ), patch(
+        "openpeerpower.helpers.translation.component_translation_file",
+        return_value="/non-existing/nl.json",
+    ):
+        resources = await translation.async_get_component_resources(opp, "nl")
+
+    assert resources == {}
+    _, stored = opp.data[translation.TRANSLATION_STORE_CACHE]["nl"]
+    assert stored == {}